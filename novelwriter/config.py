@@ -785,6 +785,7 @@ class RecentProjects:
                 logger.error("Could not load recent project cache")
                 logException()
                 return False
+            self._sortData()
 
         return True
 
@@ -804,7 +805,7 @@ class RecentProjects:
         return True
 
     def listEntries(self) -> list[tuple[str, str, int, int]]:
-        """List all items in the cache."""
+        """List all items in the cache, most recently opened first."""
         return [
             (str(k), str(e["title"]), checkInt(e["words"], 0), checkInt(e["time"], 0))
             for k, e in self._data.items()
@@ -817,6 +818,7 @@ class RecentProjects:
             "words": int(words),
             "time": int(saved),
         }
+        self._sortData()
         self.saveCache()
         return
 
@@ -827,4 +829,18 @@ class RecentProjects:
             self.saveCache()
         return
 
+    ##
+    #  Internal Functions
+    ##
+
+    def _sortData(self) -> None:
+        """Sort the cache by last opened time, newest first. The cache
+        only changes when a project is opened or removed, so sorting
+        here saves the list views from doing it.
+        """
+        self._data = dict(sorted(
+            self._data.items(), key=lambda x: checkInt(x[1]["time"], 0), reverse=True
+        ))
+        return
+
 # END Class RecentProjects
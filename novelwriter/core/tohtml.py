@@ -348,18 +348,14 @@ class ToHtml(Tokenizer):
             }
         }
         with open(path, mode="w", encoding="utf-8") as fObj:
-            json.dump(data, fObj, indent=2)
+            fObj.write(json.dumps(data, indent=2))
         logger.info("Wrote file: %s", path)
         return
 
     def replaceTabs(self, nSpaces: int = 8, spaceChar: str = "&nbsp;") -> None:
         """Replace tabs with spaces in the html."""
-        htmlText = []
         tabSpace = spaceChar*nSpaces
-        for aLine in self._fullHTML:
-            htmlText.append(aLine.replace("\t", tabSpace))
-
-        self._fullHTML = htmlText
+        self._fullHTML = [p.replace("\t", tabSpace) for p in self._fullHTML]
         return
 
     def getStyleSheet(self) -> list[str]:
@@ -477,8 +473,7 @@ class ToHtml(Tokenizer):
 
     def _formatKeywords(self, text: str) -> str:
         """Apply HTML formatting to keywords."""
-        valid, bits, _ = self._project.index.scanThis("@"+text)
-        if not valid or not bits or bits[0] not in nwLabels.KEY_NAME:
+        if not (bits := self._splitKeyword(text)):
             return ""
 
         result = f"<span class='tags'>{self._localLookup(nwLabels.KEY_NAME[bits[0]])}:</span> "
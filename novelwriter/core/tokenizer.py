@@ -47,6 +47,7 @@ logger = logging.getLogger(__name__)
 
 ESCAPES = {r"\*": "*", r"\~": "~", r"\_": "_", r"\[": "[", r"\]": "]", r"\ ": ""}
 RX_ESC = re.compile("|".join([re.escape(k) for k in ESCAPES.keys()]), flags=re.DOTALL)
+TR_MAP = str.maketrans({nwUnicode.U_MAPOSS: nwUnicode.U_RSQUO})
 
 
 def stripEscape(text) -> str:
@@ -159,6 +160,8 @@ class Tokenizer(ABC):
         # Instance Variables
         self._hFormatter = HeadingFormatter(self._project)
         self._skipSeparator = False  # Flag to indicate that we skip the scene separator
+        self._keywordCache: dict[str, list[str]] = {}  # Parsed keyword lines
+        self._autoReplace: tuple[dict[str, str], re.Pattern | None] | None = None
 
         # This File
         self._isNone  = False  # Document has unknown layout
@@ -383,17 +386,22 @@ class Tokenizer(ABC):
     def doPreProcessing(self) -> None:
         """Run trough the various replace dictionaries."""
         # Process the user's auto-replace dictionary
-        autoReplace = self._project.data.autoReplace
-        if len(autoReplace) > 0:
-            repDict = {}
-            for aKey, aVal in autoReplace.items():
-                repDict[f"<{aKey}>"] = aVal
-            xRep = re.compile("|".join([re.escape(k) for k in repDict.keys()]), flags=re.DOTALL)
-            self._text = xRep.sub(lambda x: repDict[x.group(0)], self._text)
+        # The map and pattern are the same for every document, so they
+        # are only built for the first one
+        if self._autoReplace is None:
+            autoReplace = self._project.data.autoReplace
+            repDict = {f"<{aKey}>": aVal for aKey, aVal in autoReplace.items()}
+            rxRepDict = re.compile(
+                "|".join([re.escape(k) for k in repDict.keys()]), flags=re.DOTALL
+            ) if repDict else None
+            self._autoReplace = (repDict, rxRepDict)
+
+        repDict, rxRepDict = self._autoReplace
+        if rxRepDict:
+            self._text = rxRepDict.sub(lambda x: repDict[x.group(0)], self._text)
 
         # Process the character translation map
-        trDict = {nwUnicode.U_MAPOSS: nwUnicode.U_RSQUO}
-        self._text = self._text.translate(str.maketrans(trDict))
+        self._text = self._text.translate(TR_MAP)
 
         return
 
@@ -412,19 +420,22 @@ class Tokenizer(ABC):
           4: The internal formatting map of the text, self.FMT_*
           5: The style of the block, self.A_*
         """
-        self._tokens = []
+        # Frequently used values are bound to locals for the line loop
+        tokens = []
         tmpMarkdown = []
+        keepMarkdown = self._keepMarkdown
         nHead = 0
         breakNext = False
+        self._tokens = tokens
         for aLine in self._text.splitlines():
             sLine = aLine.strip().lower()
 
             # Check for blank lines
             if len(sLine) == 0:
-                self._tokens.append((
+                tokens.append((
                     self.T_EMPTY, nHead, "", [], self.A_NONE
                 ))
-                if self._keepMarkdown:
+                if keepMarkdown:
                     tmpMarkdown.append("\n")
 
                 continue
@@ -449,7 +460,7 @@ class Tokenizer(ABC):
                     continue
 
                 elif sLine == "[vspace]":
-                    self._tokens.append(
+                    tokens.append(
                         (self.T_SKIP, nHead, "", [], sAlign)
                     )
                     continue
@@ -457,13 +468,13 @@ class Tokenizer(ABC):
                 elif sLine.startswith("[vspace:") and sLine.endswith("]"):
                     nSkip = checkInt(sLine[8:-1], 0)
                     if nSkip >= 1:
-                        self._tokens.append(
+                        tokens.append(
                             (self.T_SKIP, nHead, "", [], sAlign)
                         )
                     if nSkip > 1:
-                        self._tokens += (nSkip - 1) * [
+                        tokens.extend((nSkip - 1) * [
                             (self.T_SKIP, nHead, "", [], self.A_NONE)
-                        ]
+                        ])
                     continue
 
             if aLine[0] == "%":
@@ -473,29 +484,29 @@ class Tokenizer(ABC):
 
                 cStyle, cText, _ = processComment(aLine)
                 if cStyle == nwComment.SYNOPSIS:
-                    self._tokens.append((
+                    tokens.append((
                         self.T_SYNOPSIS, nHead, cText, [], sAlign
                     ))
-                    if self._doSynopsis and self._keepMarkdown:
+                    if self._doSynopsis and keepMarkdown:
                         tmpMarkdown.append("%s\n" % aLine)
                 elif cStyle == nwComment.SHORT:
-                    self._tokens.append((
+                    tokens.append((
                         self.T_SHORT, nHead, cText, [], sAlign
                     ))
-                    if self._doSynopsis and self._keepMarkdown:
+                    if self._doSynopsis and keepMarkdown:
                         tmpMarkdown.append("%s\n" % aLine)
                 else:
-                    self._tokens.append((
+                    tokens.append((
                         self.T_COMMENT, nHead, cText, [], sAlign
                     ))
-                    if self._doComments and self._keepMarkdown:
+                    if self._doComments and keepMarkdown:
                         tmpMarkdown.append("%s\n" % aLine)
 
             elif aLine[0] == "@":
-                self._tokens.append((
+                tokens.append((
                     self.T_KEYWORD, nHead, aLine[1:].strip(), [], sAlign
                 ))
-                if self._doKeywords and self._keepMarkdown:
+                if self._doKeywords and keepMarkdown:
                     tmpMarkdown.append("%s\n" % aLine)
 
             elif aLine[:2] == "# ":
@@ -504,10 +515,10 @@ class Tokenizer(ABC):
                     sAlign |= self.A_PBB
 
                 nHead += 1
-                self._tokens.append((
+                tokens.append((
                     self.T_HEAD1, nHead, aLine[2:].strip(), [], sAlign
                 ))
-                if self._keepMarkdown:
+                if keepMarkdown:
                     tmpMarkdown.append("%s\n" % aLine)
 
             elif aLine[:3] == "## ":
@@ -515,26 +526,26 @@ class Tokenizer(ABC):
                     sAlign |= self.A_PBB
 
                 nHead += 1
-                self._tokens.append((
+                tokens.append((
                     self.T_HEAD2, nHead, aLine[3:].strip(), [], sAlign
                 ))
-                if self._keepMarkdown:
+                if keepMarkdown:
                     tmpMarkdown.append("%s\n" % aLine)
 
             elif aLine[:4] == "### ":
                 nHead += 1
-                self._tokens.append((
+                tokens.append((
                     self.T_HEAD3, nHead, aLine[4:].strip(), [], sAlign
                 ))
-                if self._keepMarkdown:
+                if keepMarkdown:
                     tmpMarkdown.append("%s\n" % aLine)
 
             elif aLine[:5] == "#### ":
                 nHead += 1
-                self._tokens.append((
+                tokens.append((
                     self.T_HEAD4, nHead, aLine[5:].strip(), [], sAlign
                 ))
-                if self._keepMarkdown:
+                if keepMarkdown:
                     tmpMarkdown.append("%s\n" % aLine)
 
             elif aLine[:3] == "#! ":
@@ -544,10 +555,10 @@ class Tokenizer(ABC):
                 else:
                     tStyle = self.T_HEAD1
 
-                self._tokens.append((
+                tokens.append((
                     tStyle, nHead, aLine[3:].strip(), [], sAlign | self.A_CENTRE
                 ))
-                if self._keepMarkdown:
+                if keepMarkdown:
                     tmpMarkdown.append("%s\n" % aLine)
 
             elif aLine[:4] == "##! ":
@@ -558,10 +569,10 @@ class Tokenizer(ABC):
                 else:
                     tStyle = self.T_HEAD2
 
-                self._tokens.append((
+                tokens.append((
                     tStyle, nHead, aLine[4:].strip(), [], sAlign
                 ))
-                if self._keepMarkdown:
+                if keepMarkdown:
                     tmpMarkdown.append("%s\n" % aLine)
 
             else:
@@ -602,10 +613,10 @@ class Tokenizer(ABC):
 
                 # Process formats
                 tLine, fmtPos = self._extractFormats(aLine)
-                self._tokens.append((
+                tokens.append((
                     self.T_TEXT, nHead, tLine, fmtPos, sAlign
                 ))
-                if self._keepMarkdown:
+                if keepMarkdown:
                     tmpMarkdown.append("%s\n" % aLine)
 
         # If we have content, turn off the first page flag
@@ -770,7 +781,7 @@ class Tokenizer(ABC):
             }
         }
         with open(path, mode="w", encoding="utf-8") as fObj:
-            json.dump(data, fObj, indent=2)
+            fObj.write(json.dumps(data, indent=2))
         return
 
     ##
@@ -812,6 +823,18 @@ class Tokenizer(ABC):
 
         return result, formats
 
+    def _splitKeyword(self, text: str) -> list[str]:
+        """Split a keyword line into its key and values. An empty list
+        is returned if the line is not a known keyword. The result is
+        cached since the same keyword lines recur across documents.
+        """
+        if (bits := self._keywordCache.get(text)) is None:
+            valid, bits, _ = self._project.index.scanThis("@"+text)
+            if not (valid and bits and bits[0] in nwLabels.KEY_NAME):
+                bits = []
+            self._keywordCache[text] = bits
+        return bits
+
 # END Class Tokenizer
 
 
@@ -45,6 +45,15 @@ class ToMarkdown(Tokenizer):
     M_STD = 0  # Standard Markdown
     M_EXT = 1  # Extended Markdown
 
+    MD_HEADS = {
+        Tokenizer.T_TITLE: "#",
+        Tokenizer.T_UNNUM: "##",
+        Tokenizer.T_HEAD1: "#",
+        Tokenizer.T_HEAD2: "##",
+        Tokenizer.T_HEAD3: "###",
+        Tokenizer.T_HEAD4: "####",
+    }
+
     def __init__(self, project: NWProject) -> None:
         super().__init__(project)
         self._genMode = self.M_STD
@@ -130,29 +139,9 @@ class ToMarkdown(Tokenizer):
                     lines.append(f"{tTemp}\n\n")
                 para = []
 
-            elif tType == self.T_TITLE:
-                tHead = tText.replace(nwHeadFmt.BR, "\n")
-                lines.append(f"# {tHead}\n\n")
-
-            elif tType == self.T_UNNUM:
-                tHead = tText.replace(nwHeadFmt.BR, "\n")
-                lines.append(f"## {tHead}\n\n")
-
-            elif tType == self.T_HEAD1:
-                tHead = tText.replace(nwHeadFmt.BR, "\n")
-                lines.append(f"# {tHead}\n\n")
-
-            elif tType == self.T_HEAD2:
-                tHead = tText.replace(nwHeadFmt.BR, "\n")
-                lines.append(f"## {tHead}\n\n")
-
-            elif tType == self.T_HEAD3:
-                tHead = tText.replace(nwHeadFmt.BR, "\n")
-                lines.append(f"### {tHead}\n\n")
-
-            elif tType == self.T_HEAD4:
+            elif tType in self.MD_HEADS:
                 tHead = tText.replace(nwHeadFmt.BR, "\n")
-                lines.append(f"#### {tHead}\n\n")
+                lines.append(f"{self.MD_HEADS[tType]} {tHead}\n\n")
 
             elif tType == self.T_SEP:
                 lines.append(f"{tText}\n\n")
@@ -207,15 +196,12 @@ class ToMarkdown(Tokenizer):
 
     def _formatKeywords(self, text: str, style: int) -> str:
         """Apply Markdown formatting to keywords."""
-        valid, bits, _ = self._project.index.scanThis("@"+text)
-        if not valid or not bits:
+        if not (bits := self._splitKeyword(text)):
             return ""
 
-        result = ""
-        if bits[0] in nwLabels.KEY_NAME:
-            result += f"**{self._localLookup(nwLabels.KEY_NAME[bits[0]])}:** "
-            if len(bits) > 1:
-                result += ", ".join(bits[1:])
+        result = f"**{self._localLookup(nwLabels.KEY_NAME[bits[0]])}:** "
+        if len(bits) > 1:
+            result += ", ".join(bits[1:])
 
         result += "  \n" if style & self.A_Z_BTMMRG else "\n\n"
 
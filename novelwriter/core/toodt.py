@@ -574,8 +574,7 @@ class ToOdt(Tokenizer):
 
     def _formatKeywords(self, text: str) -> tuple[str, list[tuple[int, int]]]:
         """Apply formatting to keywords."""
-        valid, bits, _ = self._project.index.scanThis("@"+text)
-        if not valid or not bits or bits[0] not in nwLabels.KEY_NAME:
+        if not (bits := self._splitKeyword(text)):
             return "", []
 
         rTxt = f"{self._localLookup(nwLabels.KEY_NAME[bits[0]])}: "
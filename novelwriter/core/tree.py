@@ -119,7 +119,7 @@ class NWTree:
         parent, None is returned. For root elements, this cannot occur.
         """
         parent = None if itemType == nwItemType.ROOT else parent
-        if parent is None or parent in self._order:
+        if parent is None or parent in self._tree:
             tHandle = self._makeHandle()
             newItem = NWItem(self._project, tHandle)
             newItem.setName(label)
@@ -148,7 +148,6 @@ class NWTree:
 
         if nwItem.isRootType():
             logger.debug("Item '%s' is a root item", str(tHandle))
-            self._roots[tHandle] = nwItem
             if nwItem.itemClass == nwItemClass.TRASH:
                 if self._trash is None:
                     logger.debug("Item '%s' is the trash folder", str(tHandle))
@@ -156,6 +155,7 @@ class NWTree:
                 else:
                     logger.error("Only one trash folder allowed")
                     return False
+            self._roots[tHandle] = nwItem
 
         self._tree[tHandle] = nwItem
         self._order.append(tHandle)
@@ -165,8 +165,7 @@ class NWTree:
 
     def duplicate(self, sHandle: str) -> NWItem | None:
         """Duplicate an item and set a new handle."""
-        sItem = self.__getitem__(sHandle)
-        if isinstance(sItem, NWItem):
+        if isinstance(sItem := self._tree.get(sHandle), NWItem):
             nItem = NWItem.duplicate(sItem, self._makeHandle())
             if self.append(nItem):
                 logger.info("Duplicated item '%s' -> '%s'", sHandle, nItem.itemHandle)
@@ -179,8 +178,7 @@ class NWTree:
         """
         tree = []
         for tHandle in self._order:
-            tItem = self.__getitem__(tHandle)
-            if tItem:
+            if tItem := self._tree.get(tHandle):
                 tree.append(tItem.pack())
         return tree
 
@@ -206,8 +204,22 @@ class NWTree:
         """
         storage = self._project.storage
         files = set(storage.scanContent())
-        for tHandle in self._order:
-            if self.updateItemData(tHandle):
+        roots: dict[str, NWItem | None] = {}  # The root item of each checked handle
+        for tHandle in self.handles():  # Iterate a copy as failed items are removed
+            tItem = self._tree.get(tHandle)
+            if tItem and tItem.itemParent in roots:
+                # Parents usually precede their children, so we can
+                # reuse the parent's root instead of walking the path
+                if rItem := roots[tItem.itemParent]:
+                    tItem.setRoot(rItem.itemHandle)
+                    tItem.setClassDefaults(rItem.itemClass)
+            elif tItem and self.updateItemData(tHandle):
+                rItem = self._tree.get(tItem.itemRoot)
+            else:
+                rItem = None
+
+            roots[tHandle] = rItem
+            if rItem:
                 logger.debug("Checking item '%s' ... OK", tHandle)
                 files.discard(tHandle)  # Remove it from the record
             else:
@@ -227,7 +239,7 @@ class NWTree:
             oName, oParent, oClass, oLayout = aDoc.getMeta()
 
             oName = oName or cHandle
-            oParent = oParent if oParent in self._order else None
+            oParent = oParent if oParent in self._tree else None
             oClass = oClass or nwItemClass.NOVEL
             oLayout = oLayout or nwItemLayout.NOTE
 
@@ -263,38 +275,44 @@ class NWTree:
         if not (isinstance(contentPath, Path) and isinstance(runtimePath, Path)):
             return False
 
-        tocList = []
-        tocLen = 0
-        for tHandle in self._order:
-            tItem = self.__getitem__(tHandle)
-            if tItem is None:
-                continue
-
-            tFile = tHandle+".nwd"
-            if (contentPath / tFile).is_file():
-                tocLine = "{0:<25s}  {1:<9s}  {2:<8s}  {3:s}".format(
-                    str(Path("content") / tFile),
-                    tItem.itemClass.name,
-                    tItem.itemLayout.name,
-                    tItem.itemName,
-                )
-                tocList.append(tocLine)
-                tocLen = max(tocLen, len(tocLine))
-
         try:
+            # Collect the document handles in one directory scan instead
+            # of checking each item's file separately
+            present = set(self._project.storage.scanContent())
+
+            tocList = []
+            tocLen = 0
+            for tHandle in self._order:
+                tItem = self._tree.get(tHandle)
+                if tItem is None:
+                    continue
+
+                if tHandle in present:
+                    tFile = tHandle+".nwd"
+                    tocLine = "{0:<25s}  {1:<9s}  {2:<8s}  {3:s}".format(
+                        str(Path("content") / tFile),
+                        tItem.itemClass.name,
+                        tItem.itemLayout.name,
+                        tItem.itemName,
+                    )
+                    tocList.append(tocLine)
+                    tocLen = max(tocLen, len(tocLine))
+
             # Dump the text
             tocText = runtimePath / nwFiles.TOC_TXT
             with open(tocText, mode="w", encoding="utf-8") as outFile:
-                outFile.write("\n")
-                outFile.write("Table of Contents\n")
-                outFile.write("=================\n")
-                outFile.write("\n")
-                outFile.write("{0:<25s}  {1:<9s}  {2:<8s}  {3:s}\n".format(
-                    "File Name", "Class", "Layout", "Document Label"
-                ))
-                outFile.write("-"*max(tocLen, 62) + "\n")
-                outFile.write("\n".join(tocList))
-                outFile.write("\n")
+                outFile.write("".join([
+                    "\n",
+                    "Table of Contents\n",
+                    "=================\n",
+                    "\n",
+                    "{0:<25s}  {1:<9s}  {2:<8s}  {3:s}\n".format(
+                        "File Name", "Class", "Layout", "Document Label"
+                    ),
+                    "-"*max(tocLen, 62) + "\n",
+                    "\n".join(tocList),
+                    "\n",
+                ]))
 
         except Exception:
             logger.error("Could not write ToC file")
@@ -307,15 +325,11 @@ class NWTree:
         """Loop over all entries and add up the word counts."""
         noteWords = 0
         novelWords = 0
-        for tHandle in self._order:
-            tItem = self.__getitem__(tHandle)
-            if tItem is None:
-                continue
-            if tItem.itemLayout == nwItemLayout.NO_LAYOUT:
-                pass
-            elif tItem.itemLayout == nwItemLayout.NOTE:
+        for tItem in self._tree.values():
+            tLayout = tItem.itemLayout
+            if tLayout == nwItemLayout.NOTE:
                 noteWords += tItem.wordCount
-            else:
+            elif tLayout != nwItemLayout.NO_LAYOUT:
                 novelWords += tItem.wordCount
         return novelWords, noteWords
 
@@ -327,26 +341,17 @@ class NWTree:
         """Update the root item handle of a given item. Returns True if
         a root was found and data updated, otherwise False.
         """
-        tItem = self.__getitem__(tHandle)
-        if tItem is None:
-            return False
-
-        iItem = tItem
-        for _ in range(MAX_DEPTH):
-            if iItem.itemParent is None:
-                tItem.setRoot(iItem.itemHandle)
-                tItem.setClassDefaults(iItem.itemClass)
-                return True
-            else:
-                iItem = self.__getitem__(iItem.itemParent)
-                if iItem is None:
-                    return False
-        else:
-            raise RecursionError("Critical internal error")
+        tTree = self.getItemPath(tHandle)
+        if tTree and (rItem := self._tree[tTree[-1]]).itemParent is None:
+            tItem = self._tree[tHandle]
+            tItem.setRoot(rItem.itemHandle)
+            tItem.setClassDefaults(rItem.itemClass)
+            return True
+        return False
 
     def checkType(self, tHandle: str, itemType: nwItemType) -> bool:
         """Check if item exists and is of the specified item type."""
-        tItem = self.__getitem__(tHandle)
+        tItem = self._tree.get(tHandle)
         if not tItem:
             return False
         return tItem.itemType == itemType
@@ -358,19 +363,14 @@ class NWTree:
         infinite loops impossible.
         """
         tTree = []
-        tItem = self.__getitem__(tHandle)
+        tItem = self._tree.get(tHandle)
         if tItem is not None:
             tTree.append(tHandle)
             for _ in range(MAX_DEPTH):
-                if tItem.itemParent is None:
+                tHandle = tItem.itemParent
+                if tHandle is None or (tItem := self._tree.get(tHandle)) is None:
                     return tTree
-                else:
-                    tHandle = tItem.itemParent
-                    tItem = self.__getitem__(tHandle)
-                    if tItem is None:
-                        return tTree
-                    else:
-                        tTree.append(tHandle)
+                tTree.append(tHandle)
             else:
                 raise RecursionError("Critical internal error")
 
@@ -390,36 +390,25 @@ class NWTree:
     def iterRoots(self, itemClass: nwItemClass | None) -> Iterator[tuple[str, NWItem]]:
         """Iterate over all root items of a given class in order."""
         for tHandle in self._order:
-            nwItem = self.__getitem__(tHandle)
-            if isinstance(nwItem, NWItem) and nwItem.isRootType():
+            if nwItem := self._roots.get(tHandle):
                 if itemClass is None or nwItem.itemClass == itemClass:
                     yield tHandle, nwItem
         return
 
     def isTrash(self, tHandle: str) -> bool:
         """Check if an item is in or is the trash folder."""
-        tItem = self.__getitem__(tHandle)
-        if tItem is None:
-            return True
-        if tItem.itemClass == nwItemClass.TRASH:
+        tItem = self._tree.get(tHandle)
+        if tItem is None or tItem.itemClass == nwItemClass.TRASH:
             return True
-        if self._trash is not None:
-            if tHandle == self._trash:
-                return True
-            elif tItem.itemParent == self._trash:
-                return True
-            elif tItem.itemRoot == self._trash:
-                return True
-        return False
+        if (trash := self._trash) is None:
+            return False
+        return tItem.itemRoot == trash or tItem.itemParent == trash or tHandle == trash
 
     def findRoot(self, itemClass: nwItemClass | None) -> str | None:
         """Find the first root item for a given class."""
-        for aRoot in self._roots:
-            tItem = self.__getitem__(aRoot)
-            if tItem is None:
-                continue
+        for tHandle, tItem in self._roots.items():
             if itemClass == tItem.itemClass:
-                return tItem.itemHandle
+                return tHandle
         return None
 
     ##
@@ -468,7 +457,7 @@ class NWTree:
 
     def __delitem__(self, tHandle: str) -> None:
         """Remove an item from the internal lists and dictionaries."""
-        if tHandle in self._order and tHandle in self._tree:
+        if tHandle in self._tree and tHandle in self._order:
             self._order.remove(tHandle)
             del self._tree[tHandle]
         else:
@@ -486,7 +475,7 @@ class NWTree:
 
     def __contains__(self, tHandle: str) -> bool:
         """Checks if a handle exists in the tree."""
-        return tHandle in self._order
+        return tHandle in self._tree
 
     def __iter__(self) -> Iterator[NWItem]:
         """Iterate through project items."""
@@ -513,12 +502,10 @@ class NWTree:
         """Generate a unique item handle. In the event that the key
         already exists, generate a new one.
         """
-        logger.debug("Generating new handle")
         handle = f"{random.getrandbits(52):013x}"
-        if handle in self._tree:
+        while handle in self._tree:
             logger.warning("Duplicate handle encountered! Retrying ...")
-            handle = self._makeHandle()
-
+            handle = f"{random.getrandbits(52):013x}"
         return handle
 
 # END Class NWTree
@@ -539,9 +539,8 @@ class GuiOutlineTree(QTreeWidget):
             with open(path, mode="w", newline="") as csvFile:
                 writer = csv.writer(csvFile, dialect="excel", quoting=csv.QUOTE_ALL)
                 writer.writerow([trConst(nwLabels.OUTLINE_COLS[col]) for col in cols])
-                for i in range(self.topLevelItemCount()):
-                    if item := self.topLevelItem(i):
-                        writer.writerow(item.text(i) for i in order)
+                items = (self.topLevelItem(i) for i in range(self.topLevelItemCount()))
+                writer.writerows([item.text(c) for c in order] for item in items if item)
         return
 
     ##
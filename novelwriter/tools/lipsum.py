@@ -41,6 +41,8 @@ logger = logging.getLogger(__name__)
 
 class GuiLipsum(QDialog):
 
+    _cachedParas: list[str] | None = None
+
     def __init__(self, parent: QWidget) -> None:
         super().__init__(parent=parent)
 
@@ -139,12 +141,16 @@ class GuiLipsum(QDialog):
     @pyqtSlot()
     def _doInsert(self) -> None:
         """Generate the text."""
-        lipsumFile = CONFIG.assetPath("text") / "lipsum.txt"
-        lipsumText = readTextFile(lipsumFile).splitlines()
-        if self.randSwitch.isChecked():
-            random.shuffle(lipsumText)
+        if not (paras := GuiLipsum._cachedParas):
+            lipsumFile = CONFIG.assetPath("text") / "lipsum.txt"
+            text = readTextFile(lipsumFile)
+            paras = [p for line in text.splitlines() if (p := line.strip())]
+            if paras:  # Don't cache a failed read
+                GuiLipsum._cachedParas = paras
         pCount = self.paraCount.value()
-        self._lipsumText = "\n\n".join(lipsumText[0:pCount]) + "\n\n"
+        if self.randSwitch.isChecked():
+            paras = random.sample(paras, min(pCount, len(paras)))
+        self._lipsumText = "\n\n".join(paras[:pCount]) + "\n\n"
         self.close()
         return
 
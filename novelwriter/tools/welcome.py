@@ -25,8 +25,8 @@ from __future__ import annotations
 
 import logging
 
+from time import localtime, strftime
 from pathlib import Path
-from datetime import datetime
 
 from PyQt5.QtGui import QCloseEvent, QColor, QFont, QPaintEvent, QPainter, QPen
 from PyQt5.QtCore import (
@@ -278,6 +278,7 @@ class _OpenProjectPage(QWidget):
         self.listWidget = QListView(self)
         self.listWidget.setItemDelegate(self.itemDelegate)
         self.listWidget.setModel(self.listModel)
+        self.listWidget.setUniformItemSizes(True)
         self.listWidget.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.listWidget.clicked.connect(self._projectClicked)
         self.listWidget.doubleClicked.connect(self._projectDoubleClicked)
@@ -454,9 +455,8 @@ class _ProjectListModel(QAbstractListModel):
         data = []
         words = self.tr("Word Count")
         opened = self.tr("Last Opened")
-        records = sorted(CONFIG.recentProjects.listEntries(), key=lambda x: x[3], reverse=True)
-        for path, title, count, time in records:
-            when = datetime.fromtimestamp(time).strftime("%x")
+        for path, title, count, stamp in CONFIG.recentProjects.listEntries():
+            when = strftime("%x", localtime(stamp))
             data.append((title, path, f"{opened}: {when}, {words}: {formatInt(count)}"))
         self._data = data
         return
@@ -23,6 +23,7 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 """
 from __future__ import annotations
 
+import csv
 import json
 import logging
 
@@ -409,12 +410,17 @@ class GuiWritingStats(QDialog):
                     wSuccess = True
 
                 if dataFmt == self.FMT_CSV:
-                    outFile.write(
-                        '"Date","Length (sec)","Words Changed",'
-                        '"Novel Words","Note Words","Idle Time (sec)"\n'
+                    writer = csv.writer(
+                        outFile, quoting=csv.QUOTE_NONNUMERIC, lineterminator="\n"
+                    )
+                    writer.writerow([
+                        "Date", "Length (sec)", "Words Changed",
+                        "Novel Words", "Note Words", "Idle Time (sec)"
+                    ])
+                    writer.writerows(
+                        [sD, round(tT), wD, wA, wB, tI]
+                        for _, sD, tT, wD, wA, wB, tI in self.filterData
                     )
-                    for _, sD, tT, wD, wA, wB, tI in self.filterData:
-                        outFile.write(f'"{sD}",{tT:.0f},{wD},{wA},{wB},{tI}\n')
                     wSuccess = True
 
         except Exception as exc:
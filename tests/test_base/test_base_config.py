@@ -401,8 +401,8 @@ def testBaseConfig_RecentCache(monkeypatch, tstPaths):
     recent.update(pathOne, "Proj One", 100, 1600002000)
     recent.update(pathTwo, "Proj Two", 200, 1600005600)
     assert recent.listEntries() == [
-        (str(pathOne), "Proj One", 100, 1600002000),
         (str(pathTwo), "Proj Two", 200, 1600005600),
+        (str(pathOne), "Proj One", 100, 1600002000),
     ]
     assert cacheFile.exists()
     cacheFile.unlink()
@@ -427,21 +427,28 @@ def testBaseConfig_RecentCache(monkeypatch, tstPaths):
     # Load Proper
     assert recent.loadCache() is True
     assert recent.listEntries() == [
-        (str(pathOne), "Proj One", 100, 1600002000),
         (str(pathTwo), "Proj Two", 200, 1600005600),
+        (str(pathOne), "Proj One", 100, 1600002000),
     ]
 
     # Remove Non-Existent Entry
     recent.remove("stuff")
     assert recent.listEntries() == [
+        (str(pathTwo), "Proj Two", 200, 1600005600),
         (str(pathOne), "Proj One", 100, 1600002000),
+    ]
+
+    # Update First Entry, which should move it to the top
+    recent.update(pathOne, "Proj One", 150, 1600009200)
+    assert recent.listEntries() == [
+        (str(pathOne), "Proj One", 150, 1600009200),
         (str(pathTwo), "Proj Two", 200, 1600005600),
     ]
 
     # Remove Second Entry
     recent.remove(pathTwo)
     assert recent.listEntries() == [
-        (str(pathOne), "Proj One", 100, 1600002000),
+        (str(pathOne), "Proj One", 150, 1600009200),
     ]
 
 # END Test testBaseConfig_RecentCache
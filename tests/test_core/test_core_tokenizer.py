@@ -219,6 +219,39 @@ def testCoreToken_TextOps(monkeypatch, mockGUI, mockRnd, fncPath):
 # END Test testCoreToken_TextOps
 
 
+@pytest.mark.core
+def testCoreToken_AutoReplace(mockGUI, mockRnd, fncPath):
+    """Test the auto-replace pre-processing over multiple documents."""
+    project = NWProject()
+    mockRnd.reset()
+    buildTestProject(project, fncPath)
+
+    # Without an auto-replace map, the text is left as is
+    tokens = BareTokenizer(project)
+    assert tokens.setText(C.hSceneDoc, "Replace <A> and <B>.\n") is True
+    tokens.doPreProcessing()
+    assert tokens._text == "Replace <A> and <B>.\n"
+    assert tokens._autoReplace == ({}, None)
+
+    # The map is built for the first document, and reused for the next
+    project.data.setAutoReplace({"A": "this", "B": "that"})
+    tokens = BareTokenizer(project)
+    assert tokens.setText(C.hSceneDoc, "Replace <A> and <B>.\n") is True
+    tokens.doPreProcessing()
+    assert tokens._text == "Replace this and that.\n"
+
+    autoReplace = tokens._autoReplace
+    assert autoReplace is not None
+    assert autoReplace[0] == {"<A>": "this", "<B>": "that"}
+
+    assert tokens.setText(C.hChapterDoc, "Then <B>, <C> and <A>.\n") is True
+    tokens.doPreProcessing()
+    assert tokens._text == "Then that, <C> and this.\n"
+    assert tokens._autoReplace is autoReplace
+
+# END Test testCoreToken_AutoReplace
+
+
 @pytest.mark.core
 def testCoreToken_StripEscape():
     """Test the stripEscape helper function."""
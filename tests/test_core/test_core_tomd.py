@@ -275,5 +275,10 @@ def testCoreToMarkdown_Format(mockGUI):
     assert toMD._formatKeywords("tag: Jane", toMD.A_NONE) == "**Tag:** Jane\n\n"
     assert toMD._formatKeywords("tag: Jane, John", toMD.A_NONE) == "**Tag:** Jane, John\n\n"
     assert toMD._formatKeywords("tag: Jane", toMD.A_Z_BTMMRG) == "**Tag:** Jane  \n"
+    assert toMD._formatKeywords("stuff: Jane", toMD.A_NONE) == ""
+
+    # Parsed keywords are cached
+    assert toMD._keywordCache["tag: Jane"] == ["@tag", "Jane"]
+    assert toMD._keywordCache["stuff: Jane"] == []
 
 # END Test testCoreToMarkdown_Format
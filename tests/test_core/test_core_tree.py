@@ -317,6 +317,28 @@ def testCoreTree_CheckConsistency(caplog: pytest.LogCaptureFixture, mockGUI, fnc
     assert isinstance(itemS, NWItem)
     assert itemS.itemParent == C.hChapterDir
 
+    # Children should get their root from their already checked parent
+    project.tree[C.hChapterDoc].setRoot(None)  # type: ignore
+    project.tree[C.hSceneDoc].setRoot(None)  # type: ignore
+    assert project.tree.checkConsistency("Recovered") == (0, 0)
+    assert project.tree[C.hChapterDoc].itemRoot == C.hNovelRoot  # type: ignore
+    assert project.tree[C.hSceneDoc].itemRoot == C.hNovelRoot  # type: ignore
+
+    # Give the chapter folder an unknown parent, which should remove
+    # the folder and all its children, and recover both documents
+    caplog.clear()
+    project.tree[C.hChapterDir].setParent(C.hInvalid)  # type: ignore
+    assert project.tree.checkConsistency("Recovered") == (2, 2)
+    assert f"'{C.hChapterDir}' ... ERROR" in caplog.text
+    assert f"'{C.hChapterDoc}' ... ERROR" in caplog.text
+    assert f"'{C.hSceneDoc}' ... ERROR" in caplog.text
+    assert C.hChapterDir not in project.tree
+    for tHandle in (C.hChapterDoc, C.hSceneDoc):
+        tItem = project.tree[tHandle]
+        assert isinstance(tItem, NWItem)
+        assert tItem.itemParent == C.hNovelRoot
+        assert tItem.itemRoot == C.hNovelRoot
+
     # Create a new file with no meta data, and let the function handle it as orphaned
     xHandle = "0123456789abc"
     contentPath = project.storage.contentPath
@@ -539,17 +561,13 @@ def testCoreTree_ToCFile(monkeypatch, fncPath, mockGUI, mockItems):
     assert len(tree) == len(mockItems)
     tree._order.append("stuff")
 
-    def mockIsFile(fileName):
-        """Return True for items that are files in novelWriter and
-        should thus also be files in the project folder structure.
-        """
-        dItem = tree[fileName.name[:13]]
-        assert dItem is not None
-        return dItem.itemType == nwItemType.FILE
-
-    monkeypatch.setattr("pathlib.Path.is_file", mockIsFile)
+    # Only items that are files in novelWriter should also be files in
+    # the project folder structure
     project._storage._runtimePath = fncPath
     (fncPath / "content").mkdir()
+    for nwItem in mockItems:
+        if nwItem.itemType == nwItemType.FILE:
+            (fncPath / "content" / f"{nwItem.itemHandle}.nwd").touch()
 
     # Block extraction of the path
     with monkeypatch.context() as mp:
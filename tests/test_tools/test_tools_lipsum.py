@@ -40,18 +40,51 @@ def testToolLipsum_Main(qtbot, monkeypatch, nwGUI, projPath, mockRnd):
     buildTestProject(nwGUI, projPath)
     nwLipsum = GuiLipsum(nwGUI)
 
+    # A failed read should not be cached
+    monkeypatch.setattr(GuiLipsum, "_cachedParas", None)
+    with monkeypatch.context() as mp:
+        mp.setattr("novelwriter.tools.lipsum.readTextFile", lambda *a: "")
+        nwLipsum._doInsert()
+        assert nwLipsum.lipsumText == "\n\n"
+        assert GuiLipsum._cachedParas is None
+
+    # Blank and whitespace-only lines should be skipped
+    with monkeypatch.context() as mp:
+        mp.setattr(
+            "novelwriter.tools.lipsum.readTextFile",
+            lambda *a: "\nFoo\n\n   \n\t\n  Bar  \n\nBaz\n"
+        )
+        nwLipsum.paraCount.setValue(3)
+        nwLipsum._doInsert()
+        assert GuiLipsum._cachedParas == ["Foo", "Bar", "Baz"]
+        assert nwLipsum.lipsumText == "Foo\n\nBar\n\nBaz\n\n"
+        assert "" not in nwLipsum.lipsumText.split("\n\n")[:-1]
+
+    monkeypatch.setattr(GuiLipsum, "_cachedParas", None)
+
     # Generate paragraphs
     nwGUI.docEditor.setCursorPosition(100)  # End of document
     nwLipsum.paraCount.setValue(2)
     nwLipsum._doInsert()
     assert "Lorem ipsum" in nwLipsum.lipsumText
 
-    # Generate random paragraph
+    # The paragraphs should now be cached
+    paras = GuiLipsum._cachedParas
+    assert isinstance(paras, list)
+    assert len(paras) == 100
+    assert nwLipsum.lipsumText == "\n\n".join(paras[:2]) + "\n\n"
+    cached = paras.copy()
+
+    # Generate random paragraphs
     nwGUI.docEditor.setCursorPosition(1000)  # End of document
     nwLipsum.randSwitch.setChecked(True)
-    nwLipsum.paraCount.setValue(1)
+    nwLipsum.paraCount.setValue(3)
     nwLipsum._doInsert()
-    assert len(nwLipsum.lipsumText) > 0
+    chosen = nwLipsum.lipsumText.split("\n\n")
+    assert chosen[-1] == ""
+    assert len(set(chosen[:-1])) == 3
+    assert all(p in cached for p in chosen[:-1])
+    assert GuiLipsum._cachedParas == cached
 
     nwLipsum.setObjectName("")
     nwLipsum.close()
@@ -120,6 +120,14 @@ def testToolWritingStats_Main(qtbot, monkeypatch, nwGUI, projPath, tstPaths):
     assert sessLog._saveData(sessLog.FMT_JSON)
 
     # Check the exported files
+    csvStats = tstPaths.tmpDir / "sessionStats.csv"
+    csvData = csvStats.read_text(encoding="utf-8").splitlines()
+    assert len(csvData) == 9
+    assert csvData[0] == (
+        '"Date","Length (sec)","Words Changed","Novel Words","Note Words","Idle Time (sec)"'
+    )
+    assert csvData[1] == '"2021-01-31 19:00:00",1800,1,700,375,0'
+
     jsonStats = tstPaths.tmpDir / "sessionStats.json"
     with open(jsonStats, mode="r", encoding="utf-8") as inFile:
         jsonData = json.load(inFile)